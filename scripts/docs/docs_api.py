@@ -1,44 +1,88 @@
 """Docs API for loading and querying docs metadata."""
 
-import os
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 from pathlib import Path
 import yaml
 
-from .utils import extract_rels, is_active
+from .sources import FilesystemSource, ParseCache
+from .utils import extract_rels, is_active, split_root_path
 
 
-class DocsRepository:
-    def __init__(self, docs_root="docs"):
-        self.docs_root = Path(docs_root)
+class BaseDocsRepository:
+    def __init__(self):
         self.docs = {}  # path -> {frontmatter, file_size, relationships}
 
+    def governed_by_targets(self, doc_path):
+        rels = self.docs[doc_path]["relationships"].get("governed_by", [])
+        return [t for t in rels if t in self.docs]
+
+    def get_docs(self):
+        return self.docs
+
+    def local_path(self, path):
+        return path
+
+    def find_docs(self, path):
+        """Return doc paths equal to path, or whose local path equals it."""
+        return [p for p in self.docs if path in (p, self.local_path(p))]
+
+
+class DocsRepository(BaseDocsRepository):
+    def __init__(self, docs_root="docs", source=None, cache=None):
+        super().__init__()
+        # With an explicit source, docs_root is relative to that source.
+        # Otherwise paths are relative to the parent of docs_root.
+        self.docs_root = Path(docs_root)
+        if source is None:
+            source = FilesystemSource(self.docs_root.parent)
+            self._docs_dir = self.docs_root.name
+        else:
+            self._docs_dir = self.docs_root.as_posix()
+        self.source = source
+        self.cache = cache if cache is not None else ParseCache()
+
     def load_docs(self, include_drafts=False):
-        for md_file in self.docs_root.rglob("*.md"):
-            rel_path = md_file.relative_to(self.docs_root)
-            if rel_path.parts and rel_path.parts[0] == "work":
+        docs_dir = self._docs_dir
+        for rel_path in self.source.list_files(docs_dir, ".md"):
+            sub_path = Path(rel_path).relative_to(docs_dir)
+            if sub_path.parts and sub_path.parts[0] == "work":
                 continue
-            frontmatter = self._parse_frontmatter(md_file)
+            frontmatter = self._parse_frontmatter(rel_path)
             if not frontmatter:
                 continue
             doc_status = frontmatter.get("doc_status")
             if not include_drafts and not is_active(doc_status):
                 continue
-            rel_path = str(md_file.relative_to(self.docs_root.parent))
             self.docs[rel_path] = {
                 "frontmatter": frontmatter,
-                "file_size": os.path.getsize(md_file),
+                "file_size": self.source.size(rel_path),
                 "relationships": self._process_relationships(frontmatter),
             }
 
-    def _parse_frontmatter(self, md_file):
+    def _parse_frontmatter(self, rel_path):
+        # Read outside the cached callable so I/O errors propagate and are
+        # never cached; only the outcome of parsing the content is cached.
         try:
-            content = md_file.read_text(encoding="utf-8")
+            content = self.source.read_text(rel_path)
+        except UnicodeDecodeError:
+            return None
+
+        def parse():
             if not content.startswith("---"):
                 return None
             parts = content.split("---", 2)
-            return yaml.safe_load(parts[1]) if len(parts) >= 3 else None
-        except Exception:
-            return None
+            try:
+                return yaml.safe_load(parts[1]) if len(parts) >= 3 else None
+            except yaml.YAMLError:
+                return None
+
+        # Sources without object ids are keyed by content, so identical docs
+        # under different roots share one parse.
+        key = self.source.cache_key(rel_path)
+        if key is None:
+            key = f"sha1:{hashlib.sha1(content.encode('utf-8')).hexdigest()}"
+        return self.cache.get(key, parse)
 
     def _process_relationships(self, frontmatter):
         return {
@@ -49,9 +93,82 @@ class DocsRepository:
             "related": extract_rels(frontmatter.get("related", {})),
         }
 
-    def governed_by_targets(self, doc_path):
-        rels = self.docs[doc_path]["relationships"].get("governed_by", [])
-        return [t for t in rels if t in self.docs]
+    def read_text(self, path, errors="strict"):
+        return self.source.read_text(path, errors=errors)
 
-    def get_docs(self):
-        return self.docs
+    def path_exists(self, path):
+        return self.source.exists(path)
+
+    def is_file(self, path):
+        return self.source.is_file(path)
+
+
+class FederatedDocsRepository(BaseDocsRepository):
+    """Several named docs roots queried as one repository.
+
+    Each root is a repository base containing a `docs/` directory. Doc paths
+    are namespaced as `<root>:<path>`. Relationship targets without a known
+    root prefix resolve within the doc's own root.
+    """
+
+    def __init__(self, roots, cache=None, max_workers=None):
+        for name, base in roots.items():
+            if not (Path(base) / "docs").is_dir():
+                raise ValueError(f"root {name} has no docs/ directory: {base}")
+        super().__init__()
+        self.cache = cache if cache is not None else ParseCache()
+        self.members = {
+            name: DocsRepository(Path(base) / "docs", cache=self.cache)
+            for name, base in roots.items()
+        }
+        self.max_workers = max_workers
+
+    def load_docs(self, include_drafts=False):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                name: pool.submit(member.load_docs, include_drafts=include_drafts)
+                for name, member in self.members.items()
+            }
+            for name, future in futures.items():
+                try:
+                    future.result()
+                except OSError as exc:
+                    raise OSError(f"root {name}: {exc}") from exc
+
+        empty = [name for name, member in self.members.items() if not member.get_docs()]
+        if empty:
+            raise ValueError(f"roots loaded no docs: {', '.join(empty)}")
+
+        for name, member in self.members.items():
+            for path, data in member.get_docs().items():
+                relationships = {
+                    rel_type: [self.qualify(name, t) for t in targets]
+                    for rel_type, targets in data["relationships"].items()
+                }
+                self.docs[f"{name}:{path}"] = {**data, "relationships": relationships}
+
+    def qualify(self, root, path):
+        target_root, _ = split_root_path(path, self.members)
+        return path if target_root else f"{root}:{path}"
+
+    def _resolve(self, path):
+        root, local = split_root_path(path, self.members)
+        return (self.members[root], local) if root else (None, path)
+
+    def local_path(self, path):
+        """Strip a known `<root>:` namespace from a doc path."""
+        return split_root_path(path, self.members)[1]
+
+    def read_text(self, path, errors="strict"):
+        member, local = self._resolve(path)
+        if member is None:
+            raise FileNotFoundError(path)
+        return member.read_text(local, errors=errors)
+
+    def path_exists(self, path):
+        member, local = self._resolve(path)
+        return member is not None and member.path_exists(local)
+
+    def is_file(self, path):
+        member, local = self._resolve(path)
+        return member is not None and member.is_file(local)
@@ -12,8 +12,8 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
-from scripts.docs.docs_api import DocsRepository
-from scripts.docs.utils import format_size_kb, normalize_filter_path
+from scripts.docs.docs_api import DocsRepository, FederatedDocsRepository
+from scripts.docs.utils import format_size_kb, normalize_filter_path, parse_root_specs
 
 
 def render_implemented_by(repo, node, prefix, is_last):
@@ -88,16 +88,34 @@ def render_tree(repo, root, child_map):
 def main():
     parser = argparse.ArgumentParser(description="Render governed_by graph from entrypoint")
     parser.add_argument("--from", dest="entry", help="Entrypoint doc path")
+    parser.add_argument(
+        "--root",
+        action="append",
+        metavar="NAME=PATH",
+        help="Index a federation of repository bases, each with docs/ (repeatable)",
+    )
     args = parser.parse_args()
+    try:
+        roots = parse_root_specs(args.root)
+    except ValueError as exc:
+        parser.error(str(exc))
 
-    repo = DocsRepository()
-    repo.load_docs(include_drafts=False)
+    try:
+        repo = FederatedDocsRepository(roots) if roots else DocsRepository()
+        repo.load_docs(include_drafts=False)
+    except (ValueError, OSError) as exc:
+        parser.error(str(exc))
 
     if args.entry:
         entry = normalize_filter_path(args.entry)
-        if entry not in repo.get_docs():
+        matches = repo.find_docs(entry)
+        if not matches:
             print(f"Entry not found in docs: {entry}")
             sys.exit(1)
+        if len(matches) > 1:
+            print(f"Entry is ambiguous across roots: {entry} ({', '.join(sorted(matches))})")
+            sys.exit(1)
+        entry = matches[0]
         child_map = {}
         for doc_path in repo.get_docs().keys():
             child_map[doc_path] = repo.governed_by_targets(doc_path)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Resolve which .cursor/rules apply to repo paths.
+
+@implements docs/system/model/docs-rules-output.md
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+import yaml
+
+ROOT = Path(__file__).resolve().parents[2]
+RULES_DIR = ROOT / ".cursor" / "rules"
+DOMAINS_DIR = ROOT / "docs" / "domains"
+
+
+def load_frontmatter(path):
+    content = path.read_text(encoding="utf-8")
+    if not content.startswith("---"):
+        return None, content
+    parts = content.split("---", 2)
+    if len(parts) < 3:
+        return None, content
+    return yaml.safe_load(parts[1]), parts[2]
+
+
+def split_globs(value):
+    """Return the globs in a `globs` value; raise ValueError if malformed."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = split_outside_braces(value)
+    elif not isinstance(value, list):
+        raise ValueError(f"globs must be a string or list, got {type(value).__name__}")
+    globs = []
+    for glob in value:
+        if not isinstance(glob, str):
+            raise ValueError(f"glob must be a string, got {glob!r}")
+        if glob.strip():
+            globs.append(glob.strip())
+    return globs
+
+
+def split_outside_braces(value):
+    parts = []
+    depth = 0
+    start = 0
+    for i, c in enumerate(value):
+        if c == "{":
+            depth += 1
+        elif c == "}" and depth:
+            depth -= 1
+        elif c == "," and not depth:
+            parts.append(value[start:i])
+            start = i + 1
+    parts.append(value[start:])
+    return parts
+
+
+def find_closing_brace(value, start):
+    """Return the index of the brace closing the one at start, or -1."""
+    depth = 0
+    for i in range(start, len(value)):
+        if value[i] == "{":
+            depth += 1
+        elif value[i] == "}":
+            depth -= 1
+            if not depth:
+                return i
+    return -1
+
+
+def glob_to_regex(glob):
+    """Translate a rule glob to a regex anchored at the repo root.
+
+    Globs without a slash match the basename at any depth, and a trailing
+    slash matches everything under the directory, as in gitignore.
+    """
+    if "/" not in glob.rstrip("/"):
+        glob = f"**/{glob}"
+    if glob.endswith("/"):
+        glob = f"{glob}**"
+    return _translate(glob)
+
+
+def _translate(glob):
+    out = []
+    i = 0
+    n = len(glob)
+    while i < n:
+        c = glob[i]
+        if glob.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = glob.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = glob[i + 1 : end].replace("\\", "\\\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        elif c == "{":
+            end = find_closing_brace(glob, i)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            options = split_outside_braces(glob[i + 1 : end])
+            out.append("(?:" + "|".join(_translate(o) for o in options) + ")")
+            i = end + 1
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class RulesMatcher:
+    def __init__(self, rules_dir=RULES_DIR):
+        self.rules_dir = Path(rules_dir)
+        self.rules = {}  # name -> {path, description, globs, always_apply, body}
+        self.invalid = {}  # name -> reason the rule could not be loaded
+        self._pattern = None
+        self._groups = {}  # regex group name -> rule name
+
+    def load_rules(self):
+        for path in sorted(self.rules_dir.glob("*.mdc")):
+            try:
+                rule = self._load_rule(path)
+            except (OSError, UnicodeDecodeError, yaml.YAMLError, ValueError) as exc:
+                self.invalid[path.stem] = " ".join(str(exc).split()) or type(exc).__name__
+                continue
+            self.rules[path.stem] = rule
+        self._compile()
+
+    def _load_rule(self, path):
+        fm, body = load_frontmatter(path)
+        fm = fm or {}
+        if not isinstance(fm, dict):
+            raise ValueError("frontmatter must be a mapping")
+        globs = split_globs(fm.get("globs"))
+        for glob in globs:
+            try:
+                re.compile(glob_to_regex(glob))
+            except re.error as exc:
+                raise ValueError(f"bad glob {glob!r}: {exc}") from exc
+        return {
+            "path": str(path.relative_to(ROOT)) if path.is_relative_to(ROOT) else str(path),
+            "description": str(fm.get("description", "")).strip(),
+            "globs": globs,
+            "always_apply": bool(fm.get("alwaysApply", False)),
+            "body": body,
+        }
+
+    def _compile(self):
+        # Each glob becomes an optional lookahead with its own group, so a
+        # single match() call reports every glob that matches the path.
+        parts = []
+        self._groups = {}
+        for name, rule in self.rules.items():
+            for glob in rule["globs"]:
+                group = f"g{len(self._groups)}"
+                self._groups[group] = name
+                parts.append(f"(?=(?P<{group}>{glob_to_regex(glob)})\\Z)?")
+        self._pattern = re.compile("".join(parts))
+
+    def match(self, path):
+        """Return rule names whose globs match path, in rule order."""
+        path = path[2:] if path.startswith("./") else path
+        groups = self._pattern.match(path).groupdict()
+        hits = {self._groups[g] for g, value in groups.items() if value is not None}
+        return [name for name in self.rules if name in hits]
+
+    def match_many(self, paths):
+        return {path: self.match(path) for path in paths}
+
+    def applicable(self, path):
+        """Return rules that apply to path: globbed matches plus alwaysApply rules."""
+        hits = set(self.match(path))
+        return [
+            name
+            for name, rule in self.rules.items()
+            if rule["always_apply"] or name in hits
+        ]
+
+    def unmatched_rules(self, paths):
+        globbed = [name for name, rule in self.rules.items() if rule["globs"]]
+        seen = set()
+        for path in paths:
+            seen.update(self.match(path))
+            if len(seen) == len(globbed):
+                break
+        return [name for name in globbed if name not in seen]
+
+    def routers_for_domain(self, domain_id):
+        """Rules named after the domain or with a glob under its docs directory."""
+        marker = f"docs/{domain_id}/"
+        return [
+            name
+            for name, rule in self.rules.items()
+            if name == domain_id or any(g.startswith(marker) for g in rule["globs"])
+        ]
+
+
+def list_domain_ids(domains_dir=DOMAINS_DIR):
+    ids = []
+    for path in sorted(Path(domains_dir).glob("*.md")):
+        try:
+            fm, _ = load_frontmatter(path)
+        except Exception:
+            continue
+        if fm and str(fm.get("domain_id", "")).strip():
+            ids.append(str(fm["domain_id"]).strip())
+    return ids
+
+
+def list_repo_files():
+    result = subprocess.run(
+        ["git", "ls-files", "--cached", "--others", "--exclude-standard"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    if result.returncode == 0:
+        return sorted(set(line for line in result.stdout.splitlines() if line))
+    return sorted(
+        str(p.relative_to(ROOT))
+        for p in ROOT.rglob("*")
+        if p.is_file() and ".git" not in p.relative_to(ROOT).parts
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve .cursor/rules for repo paths")
+    parser.add_argument("paths", nargs="*", help="Paths to resolve (use - to read stdin)")
+    args = parser.parse_args()
+
+    matcher = RulesMatcher()
+    matcher.load_rules()
+
+    paths = args.paths
+    if paths == ["-"]:
+        paths = [line.strip() for line in sys.stdin if line.strip()]
+
+    invalid = [f"invalid rule: {name}: {reason}" for name, reason in matcher.invalid.items()]
+
+    if paths:
+        print("path | rules")
+        for path in paths:
+            print(f"{path} | {', '.join(matcher.applicable(path))}")
+        if invalid:
+            print("")
+            for line in invalid:
+                print(f"- {line}")
+            raise SystemExit(1)
+        return
+
+    print("rule | alwaysApply | globs | path")
+    for name, rule in matcher.rules.items():
+        always = "true" if rule["always_apply"] else "false"
+        print(f"{name} | {always} | {', '.join(rule['globs'])} | {rule['path']}")
+
+    # Unmatched rules are warnings: some target files created at runtime,
+    # such as the objective graph under docs/work/.
+    warnings = [
+        f"rule matches no files: {name}"
+        for name in matcher.unmatched_rules(list_repo_files())
+    ]
+    problems = invalid + [
+        f"domain without router: {domain_id}"
+        for domain_id in list_domain_ids()
+        if not matcher.routers_for_domain(domain_id)
+    ]
+
+    if warnings or problems:
+        print("")
+        for line in warnings + problems:
+            print(f"- {line}")
+    if problems:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
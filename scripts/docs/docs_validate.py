@@ -19,8 +19,9 @@ import sys
 ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))
 
-from scripts.docs.docs_api import DocsRepository
-from scripts.docs.utils import normalize_filter_path, repo_path_exists
+from scripts.docs.docs_api import DocsRepository, FederatedDocsRepository
+from scripts.docs.sources import GitSource, ParseCache
+from scripts.docs.utils import normalize_filter_path, parse_root_specs
 from scripts.docs.contract_specs import (
     ALLOWED_DOC_STATUS,
     ALLOWED_DOMAIN_STATUS,
@@ -86,9 +87,9 @@ def validate_decision_frontmatter(repo):
 def validate_task_values(repo):
     errors = []
     for path, data in repo.get_docs().items():
-        if path != "docs/system/task-model.md":
+        if repo.local_path(path) != "docs/system/task-model.md":
             continue
-        content = Path(ROOT / path).read_text(encoding="utf-8")
+        content = repo.read_text(path)
         for task in TASK_VALUES:
             if f"`{task}`" not in content:
                 errors.append(f"{path}: missing task '{task}' in body")
@@ -97,21 +98,21 @@ def validate_task_values(repo):
 
 def validate_intent_task_matrix(repo):
     errors = []
-    path = "docs/system/intent-task-matrix.md"
-    if path not in repo.get_docs():
-        return errors
-    content = Path(ROOT / path).read_text(encoding="utf-8")
-    for task, intents in INTENT_TASK_MATRIX.items():
-        for intent in intents:
-            if f"`{task}`" in content and f"`{intent}`" not in content:
-                errors.append(f"{path}: missing intent '{intent}' for task '{task}'")
+    for path in repo.get_docs():
+        if repo.local_path(path) != "docs/system/intent-task-matrix.md":
+            continue
+        content = repo.read_text(path)
+        for task, intents in INTENT_TASK_MATRIX.items():
+            for intent in intents:
+                if f"`{task}`" in content and f"`{intent}`" not in content:
+                    errors.append(f"{path}: missing intent '{intent}' for task '{task}'")
     return errors
 
 
 def validate_domain_docs(repo):
     errors = []
     for path, data in repo.get_docs().items():
-        if not path.startswith("docs/domains/"):
+        if not repo.local_path(path).startswith("docs/domains/"):
             continue
         fm = data["frontmatter"]
         intent = str(fm.get("intent", "")).strip().lower()
@@ -128,7 +129,7 @@ def validate_domain_docs(repo):
             errors.append(f"{path}: missing frontmatter field 'domain_status'")
         elif domain_status not in ALLOWED_DOMAIN_STATUS:
             errors.append(f"{path}: invalid domain_status '{domain_status}'")
-        governed_by = data["relationships"].get("governed_by", [])
+        governed_by = [repo.local_path(t) for t in data["relationships"].get("governed_by", [])]
         if "docs/system/model/domain-doc.md" not in governed_by:
             errors.append(f"{path}: missing governed_by docs/system/model/domain-doc.md")
     return errors
@@ -141,15 +142,15 @@ def validate_doc_code_links(repo):
         if not implemented_by:
             continue
         for target in implemented_by:
-            if not repo_path_exists(target):
+            if not repo.path_exists(target):
                 continue
-            if target.startswith("docs/") or target.endswith(".md") or target.endswith(".mdc"):
+            target_local = repo.local_path(target)
+            if target_local.startswith("docs/") or target.endswith(".md") or target.endswith(".mdc"):
                 continue
-            target_path = ROOT / target
-            if not target_path.is_file():
+            if not repo.is_file(target):
                 continue
-            content = target_path.read_text(encoding="utf-8", errors="replace")
-            marker = f"@implements {path}"
+            content = repo.read_text(target, errors="replace")
+            marker = f"@implements {repo.local_path(path)}"
             if marker not in content:
                 errors.append(f"{path}: implemented_by {target} missing '{marker}'")
     return errors
@@ -161,7 +162,7 @@ def validate_paths_exist(repo):
         rels = data["relationships"]
         for rel_type, targets in rels.items():
             for target in targets:
-                if not repo_path_exists(target):
+                if not repo.path_exists(target):
                     errors.append(f"{path}: {rel_type} target does not exist: {target}")
     return errors
 
@@ -194,17 +195,14 @@ def validate_bidirectional(repo):
     return errors
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Validate documentation frontmatter and links")
-    parser.add_argument("--filter", help="Validate a specific doc")
-    args = parser.parse_args()
-
-    repo = DocsRepository()
-    repo.load_docs(include_drafts=True)
-
-    normalized = normalize_filter_path(args.filter)
-    if normalized and normalized in repo.get_docs():
-        repo.docs = {normalized: repo.get_docs()[normalized]}
+def run_validators(repo, file_filter=None):
+    normalized = normalize_filter_path(file_filter)
+    if normalized:
+        # An unprefixed filter selects that path in every federated root.
+        selected = repo.find_docs(normalized)
+        if not selected:
+            return [f"{normalized}: filter matches no doc"]
+        repo.docs = {path: repo.get_docs()[path] for path in selected}
 
     errors = []
     errors.extend(validate_required_frontmatter(repo))
@@ -217,13 +215,75 @@ def main():
     errors.extend(validate_doc_code_links(repo))
     errors.extend(validate_paths_exist(repo))
     errors.extend(validate_bidirectional(repo))
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate documentation frontmatter and links")
+    parser.add_argument("--filter", help="Validate a specific doc")
+    parser.add_argument("--rev", help="Validate docs at a git revision without checkout")
+    parser.add_argument(
+        "--root",
+        action="append",
+        metavar="NAME=PATH",
+        help="Validate a federation of repository bases, each with docs/ (repeatable)",
+    )
+    args = parser.parse_args()
+    if args.rev and args.root:
+        parser.error("--rev cannot be combined with --root")
+    try:
+        roots = parse_root_specs(args.root)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if roots:
+        try:
+            repo = FederatedDocsRepository(roots)
+            repo.load_docs(include_drafts=True)
+        except (ValueError, OSError) as exc:
+            parser.error(str(exc))
+        errors = run_validators(repo, args.filter)
+        report(errors)
+    elif args.rev:
+        try:
+            source = GitSource(args.rev, repo_root=ROOT)
+            cache = ParseCache(source.parse_cache_path())
+        except ValueError as exc:
+            print(f"Unknown revision: {args.rev} ({exc})")
+            raise SystemExit(1)
+        except OSError as exc:
+            print(f"Cannot read git revision {args.rev}: {exc}")
+            raise SystemExit(1)
+        repo = DocsRepository(source=source, cache=cache)
+        try:
+            with source:
+                repo.load_docs(include_drafts=True)
+                errors = run_validators(repo, args.filter)
+        except OSError as exc:
+            print(f"Cannot read git revision {args.rev}: {exc}")
+            raise SystemExit(1)
+        report(errors)
+        try:
+            cache.prune(source.present_objects(cache.object_ids()))
+            cache.save()
+        except (OSError, TypeError, ValueError):
+            pass
+    else:
+        repo = DocsRepository()
+        repo.load_docs(include_drafts=True)
+        errors = run_validators(repo, args.filter)
+        report(errors)
+
+    if errors:
+        raise SystemExit(1)
+
 
+def report(errors):
     if errors:
         print("Validation failed")
         for err in errors:
             print(f"- {err}")
-        raise SystemExit(1)
-
+        return
     print("Validation passed")
 
 
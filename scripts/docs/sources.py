@@ -0,0 +1,241 @@
+"""File sources for docs tooling: the working tree or a git revision."""
+
+import json
+import os
+import subprocess
+from pathlib import Path
+
+
+def clean_path(path):
+    path = str(path).strip()
+    if path.startswith("./"):
+        path = path[2:]
+    return path.strip("/")
+
+
+def json_round_trips(value):
+    try:
+        return json.loads(json.dumps(value)) == value
+    except (TypeError, ValueError):
+        return False
+
+
+class ParseCache:
+    """Parsed frontmatter keyed by source cache key, optionally persisted.
+
+    Only `git:<oid>` entries whose values survive a JSON round trip unchanged
+    are written to disk; anything else (dates, sets, non-string keys) stays
+    in memory so warm and cold runs validate the same frontmatter.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self._dirty = False
+        if self.path and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == self.VERSION and isinstance(data.get("entries"), dict):
+                    self.entries = data["entries"]
+            except (OSError, ValueError, AttributeError):
+                self.entries = {}
+
+    def get(self, key, parse):
+        if key is None:
+            return parse()
+        if key not in self.entries:
+            self.entries[key] = parse()
+            self._dirty = True
+        return self.entries[key]
+
+    def object_ids(self):
+        return [key[4:] for key in self.entries if key.startswith("git:")]
+
+    def prune(self, present_oids):
+        """Drop git entries whose objects are no longer in the repository."""
+        stale = [
+            key
+            for key in self.entries
+            if key.startswith("git:") and key[4:] not in present_oids
+        ]
+        for key in stale:
+            del self.entries[key]
+        self._dirty = self._dirty or bool(stale)
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        entries = {
+            k: v
+            for k, v in self.entries.items()
+            if k.startswith("git:") and json_round_trips(v)
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"version": self.VERSION, "entries": entries}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+class FilesystemSource:
+    def __init__(self, base="."):
+        self.base = Path(base)
+
+    def list_files(self, subdir, suffix):
+        root = self.base / subdir
+        return sorted(
+            clean_path(p.relative_to(self.base).as_posix())
+            for p in root.rglob(f"*{suffix}")
+            if p.is_file()
+        )
+
+    def read_text(self, path, errors="strict"):
+        return (self.base / path).read_text(encoding="utf-8", errors=errors)
+
+    def size(self, path):
+        return os.path.getsize(self.base / path)
+
+    def exists(self, path):
+        return (self.base / path).exists()
+
+    def is_file(self, path):
+        return (self.base / path).is_file()
+
+    def cache_key(self, path):
+        # No object ids in the working tree; callers key by content instead.
+        return None
+
+    def close(self):
+        pass
+
+
+class GitSource:
+    """Read files from a git revision without checking it out.
+
+    The tree is listed once with `git ls-tree`; blobs are streamed through a
+    single long-lived `git cat-file --batch` process.
+    """
+
+    def __init__(self, rev, repo_root="."):
+        self.repo_root = Path(repo_root)
+        self.rev = rev
+        self.commit = self._git("rev-parse", "--verify", f"{rev}^{{commit}}").strip()
+        self.entries = {}  # path -> (oid, size)
+        self.dirs = {""}
+        self._proc = None
+        self._load_tree()
+
+    def _git(self, *args):
+        result = subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            cwd=self.repo_root,
+        )
+        if result.returncode != 0:
+            raise ValueError(result.stderr.strip() or f"git {args[0]} failed")
+        return result.stdout
+
+    def _load_tree(self):
+        output = self._git("ls-tree", "-r", "-l", "-z", "--full-tree", self.commit)
+        for record in output.split("\0"):
+            if not record:
+                continue
+            meta, path = record.split("\t", 1)
+            _, obj_type, oid, size = meta.split()
+            if obj_type == "blob":
+                self.entries[path] = (oid, int(size))
+            else:
+                self.dirs.add(path)
+            parent = path.rpartition("/")[0]
+            while parent and parent not in self.dirs:
+                self.dirs.add(parent)
+                parent = parent.rpartition("/")[0]
+
+    def parse_cache_path(self):
+        git_path = self._git("rev-parse", "--git-path", "docs-parse-cache.json").strip()
+        return self.repo_root / git_path
+
+    def present_objects(self, oids):
+        """Return the subset of oids that still exist in the object store."""
+        if not oids:
+            return set()
+        result = subprocess.run(
+            ["git", "cat-file", "--batch-check"],
+            input="".join(f"{oid}\n" for oid in oids),
+            capture_output=True,
+            text=True,
+            cwd=self.repo_root,
+        )
+        present = set()
+        for line in result.stdout.splitlines():
+            fields = line.split()
+            if len(fields) == 3:
+                present.add(fields[0])
+        return present
+
+    def _batch(self):
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                cwd=self.repo_root,
+            )
+        return self._proc
+
+    def read_bytes(self, path):
+        path = clean_path(path)
+        if path not in self.entries:
+            raise FileNotFoundError(f"{path} not in {self.rev}")
+        oid = self.entries[path][0]
+        proc = self._batch()
+        proc.stdin.write(f"{oid}\n".encode())
+        proc.stdin.flush()
+        line = proc.stdout.readline()
+        if not line:
+            raise OSError(f"git cat-file exited while reading {path}")
+        header = line.decode().split()
+        if len(header) != 3:
+            raise FileNotFoundError(f"{path} missing object {oid}")
+        data = proc.stdout.read(int(header[2]))
+        proc.stdout.read(1)
+        return data
+
+    def read_text(self, path, errors="strict"):
+        return self.read_bytes(path).decode("utf-8", errors=errors)
+
+    def list_files(self, subdir, suffix):
+        prefix = f"{clean_path(subdir)}/"
+        return sorted(p for p in self.entries if p.startswith(prefix) and p.endswith(suffix))
+
+    def size(self, path):
+        return self.entries[clean_path(path)][1]
+
+    def exists(self, path):
+        path = clean_path(path)
+        return path in self.entries or path in self.dirs
+
+    def is_file(self, path):
+        return clean_path(path) in self.entries
+
+    def cache_key(self, path):
+        entry = self.entries.get(clean_path(path))
+        return f"git:{entry[0]}" if entry else None
+
+    def close(self):
+        if self._proc is None:
+            return
+        self._proc.stdin.close()
+        self._proc.wait()
+        self._proc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
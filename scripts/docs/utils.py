@@ -1,7 +1,5 @@
 """Shared helpers for docs tooling."""
 
-from pathlib import Path
-
 
 def format_size_kb(size_bytes):
     return f"{size_bytes / 1024:.1f} KB"
@@ -38,11 +36,29 @@ def normalize_filter_path(file_filter):
     return cleaned
 
 
+def parse_root_specs(specs):
+    roots = {}
+    for spec in specs or []:
+        name, sep, path = spec.partition("=")
+        name = name.strip()
+        if not sep or not name or not path.strip():
+            raise ValueError(f"root must be NAME=PATH: {spec}")
+        if ":" in name or "/" in name:
+            raise ValueError(f"root name must not contain ':' or '/': {name}")
+        if name in roots:
+            raise ValueError(f"duplicate root name: {name}")
+        roots[name] = path.strip()
+    return roots
+
+
+def split_root_path(path, roots):
+    root, sep, local = path.partition(":")
+    if sep and root in roots:
+        return root, local
+    return None, path
+
+
 def is_active(doc_status):
     if doc_status is None:
         return True
     return str(doc_status).strip().lower() == "stable"
-
-
-def repo_path_exists(path):
-    return Path(path).exists()